@@ -23,7 +23,7 @@ if __name__ == '__main__':
         ],
         python_requires='>=3.6',
         package_dir={'': 'src'},
-        install_requires=['bson==0.5.10', 'motor==3.5.1', 'pydantic==1.10.13', 'rsa==4.9', "pymongo==4.8.0; python_version >= '3.7'", "python-dateutil==2.8.2; python_version >= '2.7' and python_version not in '3.0, 3.1, 3.2, 3.3'", "six==1.16.0; python_version >= '2.7' and python_version not in '3.0, 3.1, 3.2, 3.3'", "typing_extensions==4.8.0; python_version >= '3.7'"],
+        install_requires=['bson==0.5.10', 'motor==3.5.1', 'pydantic==1.10.13', 'rsa==4.9', 'cryptography==43.0.1', "pymongo==4.8.0; python_version >= '3.7'", "python-dateutil==2.8.2; python_version >= '2.7' and python_version not in '3.0, 3.1, 3.2, 3.3'", "six==1.16.0; python_version >= '2.7' and python_version not in '3.0, 3.1, 3.2, 3.3'", "typing_extensions==4.8.0; python_version >= '3.7'"],
         project_urls={
             "Homepage": "https://github.com/tritons-io/MongODM",
             "Bug Tracker": "https://github.com/tritons-io/MongODM/issues"
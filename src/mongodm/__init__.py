@@ -1,26 +1,44 @@
-import traceback
-from datetime import datetime, timezone
-from typing import Optional
-from uuid import uuid4
+import asyncio
+import copy
+import functools
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from enum import Enum
+from inspect import isclass
+from collections import deque
+from typing import Any, Optional
+from uuid import UUID, uuid4
 import logging
 
 import pymongo
+import pymongo.errors
+from pymongo import DeleteOne, InsertOne, ReturnDocument, UpdateOne
 from motor.motor_asyncio import AsyncIOMotorClient
 
 import bson.errors
 from bson import ObjectId
-from pydantic import BaseModel, BaseConfig, Field
+from pydantic import BaseModel, BaseConfig, Extra, Field, PrivateAttr
+from pydantic.fields import SHAPE_SINGLETON
 
-from mongodm.types import ObjectIdStr, EncryptedStr, decrypt
+from mongodm.types import ObjectIdStr, EncryptedStr, OBJECT_ID_PATTERN, decrypt, load_public_key, load_private_key
 from mongodm.errors import InvalidSelection, NotFound, AbstractUsage
 
 
 logger = logging.getLogger('mongodm')
 
+# Values of these types are written as is, everything else goes through pydantic's conversion
+_PLAIN_VALUE_TYPES = frozenset({str, bytes, int, float, bool, datetime, ObjectId, ObjectIdStr, EncryptedStr})
+_IMMUTABLE_FIELD_TYPES = (str, bytes, int, float, bool, date, time, Decimal, UUID, Enum, ObjectId)
+# Types that the driver already returns in the shape pydantic would validate them to
+_TRUSTED_READ_TYPES = (str, int, float, bool, datetime, Enum, ObjectId)
+# Newest documents first, shared by all the list queries that do not pass a sort
+_DEFAULT_SORT = (("created_at", pymongo.DESCENDING),)
+
 
 config = {
-    'database_connection': AsyncIOMotorClient(),
+    'database_connection': None,  # Default client created on first use, see _get_connection
     'database_name': 'database',
+    'database': None,  # Database handle cached by _get_database
     'soft_delete': False,
     'encryption_config': {
         'public_key': '',
@@ -29,18 +47,295 @@ config = {
 }
 
 
-def set_config(database_connection: AsyncIOMotorClient, database_name: str, soft_delete: bool = False):
+def set_config(database_connection: Optional[AsyncIOMotorClient], database_name: str, soft_delete: bool = False):
     config.update({
         'database_connection': database_connection,
         'database_name': database_name,
+        'database': None,
         'soft_delete': soft_delete
     })
+    _clear_collection_cache(MongoODMBase)
+
+
+def _get_connection():
+    connection = config['database_connection']
+    if connection is None:
+        connection = config['database_connection'] = AsyncIOMotorClient()
+    return connection
+
+
+def _get_database():
+    database = config['database']
+    if database is None:
+        database = config['database'] = _get_connection()[config['database_name']]
+    return database
+
+
+def _is_immutable_field(field):
+    """ Whether the values of a pydantic field can only be replaced, never modified in place """
+    return field.shape == SHAPE_SINGLETON and isclass(field.type_) and issubclass(field.type_, _IMMUTABLE_FIELD_TYPES)
+
+
+def _is_trusted_read_field(field, model_config):
+    """ Whether a value read from the database can be stored in the field without validation """
+    if not (
+        _is_immutable_field(field)
+        and issubclass(field.type_, _TRUSTED_READ_TYPES)
+        and not hasattr(field.type_, '__get_validators__')
+    ):
+        return False
+    if field.class_validators or field.pre_validators or field.post_validators:
+        return False
+    # The database holds the enum values, the validation is needed to turn them back into members
+    return model_config.use_enum_values or not issubclass(field.type_, Enum)
+
+
+def _has_value_transforms(model):
+    """ Whether the validation of the model can change values beyond their field type """
+    model_config = model.__config__
+    return bool(
+        model.__pre_root_validators__
+        or model.__post_root_validators__
+        or model.__init__ is not BaseModel.__init__
+        or model_config.extra is Extra.allow
+        or model_config.anystr_strip_whitespace
+        or model_config.anystr_upper
+        or model_config.anystr_lower
+        or model_config.min_anystr_length
+        or model_config.max_anystr_length is not None
+    )
+
+
+def _is_encrypted_field(field):
+    """ Whether a pydantic field directly holds an EncryptedStr, Optional or not """
+    return field.shape == SHAPE_SINGLETON and isclass(field.type_) and issubclass(field.type_, EncryptedStr)
+
+
+def _may_hold_encrypted(field):
+    """ Whether a pydantic field can contain an EncryptedStr, untyped containers and nested models are assumed to """
+    if field.sub_fields:
+        return any(_may_hold_encrypted(sub_field) for sub_field in field.sub_fields)
+    type_ = field.type_
+    if not isclass(type_) or type_ is object or type_ is Any:
+        return True
+    return issubclass(type_, (EncryptedStr, BaseModel, dict, list, tuple, set, frozenset))
+
+
+def _walk(item, visit_item, visit_value):
+    """
+    Replace in place the leaves of nested dicts and lists, without recursion. Leaves nested in lists (and a scalar
+    item) are replaced by visit_item(leaf), leaves directly under a dict key by visit_value(leaf) unless it is None.
+    """
+    if type(item) is not dict and type(item) is not list:
+        return visit_item(item)
+    stack = deque((item,))
+    while stack:
+        node = stack.pop()
+        if type(node) is dict:
+            for key, value in node.items():
+                if type(value) is dict or type(value) is list:
+                    stack.append(value)
+                elif visit_value is not None:
+                    node[key] = visit_value(value)
+        else:
+            for index, value in enumerate(node):
+                if type(value) is dict or type(value) is list:
+                    stack.append(value)
+                else:
+                    node[index] = visit_item(value)
+    return item
+
+
+def _rebuild(item, visit_item):
+    """
+    Same as _walk(item, visit_item, None) on copies of the nested dicts and lists, for the items given by the caller
+    that must be left untouched.
+    """
+    if type(item) is not dict and type(item) is not list:
+        return visit_item(item)
+    item = dict(item) if type(item) is dict else list(item)
+    stack = deque((item,))
+    while stack:
+        node = stack.pop()
+        if type(node) is dict:
+            for key, value in node.items():
+                if type(value) is dict:
+                    value = node[key] = dict(value)
+                    stack.append(value)
+                elif type(value) is list:
+                    value = node[key] = list(value)
+                    stack.append(value)
+        else:
+            for index, value in enumerate(node):
+                if type(value) is dict:
+                    value = node[index] = dict(value)
+                    stack.append(value)
+                elif type(value) is list:
+                    value = node[index] = list(value)
+                    stack.append(value)
+                else:
+                    node[index] = visit_item(value)
+    return item
+
+
+def _encrypt_leaf(public_key, value):
+    if isinstance(value, EncryptedStr):
+        return value.encrypt(public_key)
+    return value
+
+
+def _encode_leaf(cast_to_object_id, public_key, value):
+    if isinstance(value, EncryptedStr):
+        return value.encrypt(public_key)
+    return cast_to_object_id(value)
+
+
+def _decrypt_leaf(private_key, value):
+    if isinstance(value, bytes):
+        try:
+            return decrypt(value, private_key)
+        except Exception:
+            return value
+    return value
+
+
+def _clear_collection_cache(model):
+    for subclass in model.__subclasses__():
+        subclass.__collection_cache__ = None
+        _clear_collection_cache(subclass)
+
 
 def set_encryption_config(public_key: str, private_key: str):
     config['encryption_config'].update({
         'public_key': public_key,
         'private_key': private_key
     })
+    # Parse the keys now rather than on the first encrypted field
+    if public_key:
+        load_public_key(public_key)
+    if private_key:
+        load_private_key(private_key)
+
+
+class _FindBatcher:
+    """
+    Coalesces the get_by_id calls of a model made during the same event loop iteration into a single $in query,
+    so N concurrent lookups cost one round trip instead of N.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.pending = {}  # id -> futures waiting for the document
+        self.tasks = set()
+
+    def get(self, item_id):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self.pending:
+            loop.call_soon(self._flush)
+        self.pending.setdefault(item_id, []).append(future)
+        return future
+
+    def _flush(self):
+        pending, self.pending = self.pending, {}
+        task = asyncio.ensure_future(self._fetch(pending))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _fetch(self, pending):
+        model = self.model
+        try:
+            documents = await model.get_collection()\
+                .find(
+                    model._get_fetch_filter({"_id": {"$in": list(pending)}}),
+                    projection=model._default_projection(None)
+                )\
+                .to_list(length=None)
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        documents = {document["_id"]: document for document in documents}
+        for item_id, futures in pending.items():
+            document = documents.get(item_id)
+            for index, future in enumerate(futures):
+                if future.done():
+                    continue
+                # Instances are built in place from the document, each caller asking for the same id gets its own
+                future.set_result(copy.deepcopy(document) if index else document)
+
+
+class _BulkWriter:
+    """
+    Coalesces the writes of a model requested with bulk=True during the same event loop iteration into a single
+    unordered bulk_write. Each caller gets the outcome of its own operation.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.operations = []
+        self.futures = []
+        self.tasks = set()
+
+    def write(self, operation):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self.operations:
+            loop.call_soon(self._flush)
+        self.operations.append(operation)
+        self.futures.append(future)
+        return future
+
+    def _flush(self):
+        operations, futures = self.operations, self.futures
+        self.operations, self.futures = [], []
+        task = asyncio.ensure_future(self._write(operations, futures))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _write(self, operations, futures):
+        write_errors = {}
+        try:
+            await self.model.get_collection().bulk_write(operations, ordered=False)
+        except pymongo.errors.BulkWriteError as e:
+            write_errors = {error['index']: error for error in e.details.get('writeErrors', [])}
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for index, future in enumerate(futures):
+            if future.done():
+                continue
+            error = write_errors.get(index)
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(pymongo.errors.WriteError(error.get('errmsg'), error.get('code'), error))
+
+
+def _uuid4_hex():
+    return uuid4().hex
+
+
+def _utcnow():
+    """ Current UTC time as a naive datetime, the form pymongo stores and returns """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _encode_datetime(dt):
+    # Naive datetimes are UTC, aware ones are converted first
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt.isoformat() + "Z"
+
+
+_JSON_ENCODERS = {
+    datetime: _encode_datetime,
+    ObjectId: str
+}
 
 
 class MongODMBaseModel(BaseModel):
@@ -49,12 +344,7 @@ class MongODMBaseModel(BaseModel):
         use_enum_values = True
         allow_population_by_field_name = True
         arbitrary_types_allowed = True
-        json_encoders = {
-            datetime: lambda dt: dt.replace(tzinfo=timezone.utc)
-            .isoformat()
-            .replace("+00:00", "Z"),
-            ObjectId: str
-        }
+        json_encoders = _JSON_ENCODERS
 
 
 class MongoODMBase(MongODMBaseModel):
@@ -82,16 +372,133 @@ class MongoODMBase(MongODMBaseModel):
     """
 
     id: Optional[str] = Field(alias="_id")
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=_utcnow)
     updated_at: Optional[datetime] = None
     deleted_at: Optional[datetime] = None
 
     __protected_attributes__: set = set()
     __id_marshaller__ = str
-    __id_constructor__ = uuid4
+    __id_constructor__ = _uuid4_hex
+    __collection_cache__ = None
+    __after_find_is_noop__ = False  # Set to True to skip the after_find hooks in get_all
+    __validate_on_read__ = False  # Set to True to run the pydantic validation on the documents read from the database
+
+    _marshalled_id = PrivateAttr(default=None)  # (id, marshalled id) pair, valid while self.id is that same object
+    _dirty_fields = PrivateAttr(default=None)  # Fields assigned since the last sync with the database, if tracked
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__collection_cache__ = None
+        cls.__find_batcher__ = _FindBatcher(cls)
+        cls.__bulk_writer__ = _BulkWriter(cls)
+
+        # Fields left out of the write payloads, computed once instead of on every save
+        cls.__create_exclude__ = frozenset({"updated_at", "deleted_at"})
+        cls.__update_exclude__ = cls.__create_exclude__ | {"created_at"}
+        # __protected_attributes__ can be any iterable of field names, a list or a set
+        cls.__create_exclude_protected__ = cls.__create_exclude__.union(cls.__protected_attributes__)
+        cls.__update_exclude_protected__ = cls.__update_exclude__.union(cls.__protected_attributes__)
+
+        # Exclusion set -> (attribute name, database key) pairs of the other fields, filled by _fast_dict. The fast
+        # path is unusable with field level include/exclude, and with extra attributes that are not in __fields__.
+        cls.__serialize_fields__ = {}
+        # (database key, attribute name, field) triples for the read path
+        cls.__read_fields__ = tuple((field.alias, name, field) for name, field in cls.__fields__.items())
+        extra_allowed = cls.__config__.extra is Extra.allow
+        cls.__fast_dict_enabled__ = (
+            cls.__exclude_fields__ is None and cls.__include_fields__ is None and not extra_allowed
+        )
+
+        # Assignments are the only way to modify a model made of immutable values, so they can be tracked to send
+        # partial updates. Such a model also has no list or dict for replace_str_with_object_id to look into.
+        immutable_fields = all(_is_immutable_field(field) for field in cls.__fields__.values())
+        cls.__track_dirty_fields__ = immutable_fields and not extra_allowed
+        cls.__needs_object_id_walk__ = not immutable_fields
+        # Top level EncryptedStr fields are encrypted and decrypted by database key. The whole document is only
+        # walked when an EncryptedStr can be nested in a container or a model.
+        cls.__encrypted_fields__ = tuple(
+            field.alias for field in cls.__fields__.values() if _is_encrypted_field(field)
+        )
+        cls.__walk_encrypted__ = any(
+            _may_hold_encrypted(field) and not _is_encrypted_field(field) for field in cls.__fields__.values()
+        )
+
+        # Documents were validated before being written, models made of plain values can skip the validation on read
+        # as long as no validator or config option would transform the values again
+        cls.__construct_on_read__ = (
+            not cls.__validate_on_read__
+            and not _has_value_transforms(cls)
+            and all(_is_trusted_read_field(field, cls.__config__) for field in cls.__fields__.values())
+        )
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        dirty_fields = self._dirty_fields
+        if dirty_fields is not None and name in self.__fields__:
+            dirty_fields.add(name)
+
+    def _copy_and_set_values(self, values, fields_set, *, deep):
+        # Fields set through copy(update=...) bypass __setattr__, copies are saved in full until their next sync and
+        # marshal their own id
+        instance = super()._copy_and_set_values(values, fields_set, deep=deep)
+        object.__setattr__(instance, '_marshalled_id', None)
+        object.__setattr__(instance, '_dirty_fields', None)
+        return instance
+
+    def _mark_clean(self):
+        """ Start tracking the assigned fields, the instance is now in sync with the database """
+        if self.__track_dirty_fields__:
+            object.__setattr__(self, '_dirty_fields', set())
+
+    @classmethod
+    def _from_db(cls, item):  # -> Self
+        if cls.__walk_encrypted__:
+            item = cls.decrypt_encrypted_fields(item)
+        elif cls.__encrypted_fields__:
+            private_key = config['encryption_config']['private_key']
+            for alias in cls.__encrypted_fields__:
+                if alias in item:
+                    item[alias] = _decrypt_leaf(private_key, item[alias])
+        if cls.__construct_on_read__:
+            instance = cls._construct_from_db(item)
+        else:
+            instance = cls(**item)
+        instance._mark_clean()
+        return instance
+
+    @classmethod
+    def _construct_from_db(cls, item):  # -> Self
+        """
+        Same result as construct() called with the declared fields of the document, in a single pass over the fields
+        that renames the database keys, fills the defaults and drops the unknown keys.
+        """
+        values = {}
+        fields_set = set()
+        for alias, name, field in cls.__read_fields__:
+            if alias in item:
+                values[name] = item[alias]
+                fields_set.add(name)
+            elif not field.required:
+                values[name] = field.get_default()
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, '__dict__', values)
+        object.__setattr__(instance, '__fields_set__', fields_set)
+        instance._init_private_attributes()
+        return instance
+
+    def _get_marshalled_id(self):
+        """ Database form of the id, computed once per id instead of on every write """
+        item_id = self.id
+        cached = self._marshalled_id
+        if cached is not None and cached[0] is item_id:
+            return cached[1]
+        marshalled_id = self.__id_marshaller__(item_id)
+        object.__setattr__(self, '_marshalled_id', (item_id, marshalled_id))
+        return marshalled_id
 
     def __id_factory__(self):
-        return MongoODMBase.__id_marshaller__(MongoODMBase.__id_constructor__())
+        model = type(self)
+        return model.__id_marshaller__(model.__id_constructor__())
 
     @property
     def __collection_name__(self):
@@ -99,94 +506,147 @@ class MongoODMBase(MongODMBaseModel):
 
     @classmethod
     def get_collection(cls):
-        return config['database_connection'][config['database_name']][cls.__collection_name__]
+        collection = cls.__collection_cache__
+        if collection is None:
+            collection = _get_database()[cls.__collection_name__]
+            cls.__collection_cache__ = collection
+        return collection
 
 
     @staticmethod
     def cast_to_object_id(value):
-        if ObjectIdStr.is_object_id(value):
-            value = ObjectId(value)
+        # ObjectIds are 24 hex characters or 12 bytes, check the length before trying a conversion
+        value_type = type(value)
+        if value_type is str or value_type is ObjectIdStr:
+            if len(value) == 24 and OBJECT_ID_PATTERN.fullmatch(value):
+                return ObjectId(value)
+        elif value_type is bytes:
+            if len(value) == 12:
+                return ObjectId(value)
         return value
 
     @classmethod
     def replace_str_with_object_id(cls, item):
-        if type(item) in [bytes, str, ObjectId, ObjectIdStr]:
-            return cls.cast_to_object_id(item)
-
-        if type(item) in [list]:
-            return [cls.replace_str_with_object_id(i) for i in item]
-
-        if type(item) in [dict]:
-            for key in item.keys():
-                if isinstance(item[key], list):
-                    item[key] = [cls.replace_str_with_object_id(i) for i in item[key]]
-                if isinstance(item[key], dict):
-                    item[key] = cls.replace_str_with_object_id(item[key])
-        return item
+        # Scalar values directly under a dict key are left as is, only the values nested in lists are cast. The
+        # selectors belong to the caller, the casts are made on a copy.
+        return _rebuild(item, cls.cast_to_object_id)
 
     @classmethod
     def encrypt_encrypted_fields(cls, item):
-        if isinstance(item, EncryptedStr):
-            return item.encrypt(config['encryption_config']['public_key'])
-
-        if isinstance(item, list):
-            return [cls.encrypt_encrypted_fields(i) for i in item]
-
-        if isinstance(item, dict):
-            for key in item.keys():
-                if isinstance(item[key], list):
-                    item[key] = [cls.encrypt_encrypted_fields(i) for i in item[key]]
-                else:
-                    item[key] = cls.encrypt_encrypted_fields(item[key])
-        return item
+        encrypt_leaf = functools.partial(_encrypt_leaf, config['encryption_config']['public_key'])
+        return _walk(item, encrypt_leaf, encrypt_leaf)
 
     @classmethod
     def decrypt_encrypted_fields(cls, item):
-        if isinstance(item, bytes):
-            try:
-                return decrypt(item, config['encryption_config']['private_key'])
-            except Exception as e:
-                return item
-
-        if isinstance(item, list):
-            return [cls.decrypt_encrypted_fields(i) for i in item]
-
-        if isinstance(item, dict):
-            for key in item.keys():
-                if isinstance(item[key], list):
-                    item[key] = [cls.decrypt_encrypted_fields(i) for i in item[key]]
-                else:
-                    item[key] = cls.decrypt_encrypted_fields(item[key])
-        return item
+        decrypt_leaf = functools.partial(_decrypt_leaf, config['encryption_config']['private_key'])
+        return _walk(item, decrypt_leaf, decrypt_leaf)
+
+    @classmethod
+    def _encode_for_mongo(cls, item):
+        """ encrypt_encrypted_fields followed by replace_str_with_object_id, in a single traversal """
+        public_key = config['encryption_config']['public_key']
+        return _walk(
+            item,
+            functools.partial(_encode_leaf, cls.cast_to_object_id, public_key),
+            functools.partial(_encrypt_leaf, public_key)
+        )
 
     @classmethod
     def _get_fetch_filter(cls, selector):
         if config["soft_delete"]:
-            selector["deleted_at"] = None
+            return {**selector, "deleted_at": None}
         return selector
 
-    def _get_dict_with_oid(self, exclude=False, creation=False, exclude_none=False, exclude_unset=False):
-        to_exclude = {"updated_at", "deleted_at"}
-        if not creation:
-            to_exclude.add("created_at")
-        if exclude:
-            to_exclude = to_exclude.union(self.__protected_attributes__)
-        dump = self.dict(by_alias=True, exclude=to_exclude, exclude_none=exclude_none, exclude_unset=exclude_unset)
-        dump = self.encrypt_encrypted_fields(dump)
-        dump = self.replace_str_with_object_id(dump)
+    @classmethod
+    def _default_projection(cls, projection):
+        # Without soft delete, deleted_at is always null and does not need to be sent and decoded
+        if projection is None and not config["soft_delete"]:
+            return {"deleted_at": 0}
+        return projection
+
+    def _fast_dict(self, to_exclude, exclude_none=False, exclude_unset=False, include=None):
+        """
+        Equivalent of self.dict(by_alias=True, ...) for the write path. Plain values are copied directly, containers
+        and nested models still go through pydantic so the dump never shares mutable objects with the instance.
+        """
+        serialized_fields = self.__serialize_fields__.get(to_exclude)
+        if serialized_fields is None:
+            serialized_fields = self.__serialize_fields__[to_exclude] = tuple(
+                (name, field.alias) for name, field in self.__fields__.items() if name not in to_exclude
+            )
+        values = self.__dict__
+        fields_set = self.__fields_set__ if exclude_unset else None
+        dump = {}
+        for name, alias in serialized_fields:
+            if name not in values:
+                continue
+            if include is not None and name not in include:
+                continue
+            if fields_set is not None and name not in fields_set:
+                continue
+            value = values[name]
+            if value is None:
+                if exclude_none:
+                    continue
+            elif type(value) not in _PLAIN_VALUE_TYPES:
+                value = self._get_value(
+                    value,
+                    to_dict=True,
+                    by_alias=True,
+                    include=None,
+                    exclude=None,
+                    exclude_unset=exclude_unset,
+                    exclude_defaults=False,
+                    exclude_none=exclude_none
+                )
+            dump[alias] = value
+        return dump
+
+    def _get_dict_with_oid(self, exclude=False, creation=False, exclude_none=False, exclude_unset=False, include=None):
+        if creation:
+            to_exclude = self.__create_exclude_protected__ if exclude else self.__create_exclude__
+        else:
+            to_exclude = self.__update_exclude_protected__ if exclude else self.__update_exclude__
+        if self.__fast_dict_enabled__:
+            dump = self._fast_dict(to_exclude, exclude_none=exclude_none, exclude_unset=exclude_unset, include=include)
+        else:
+            dump = self.dict(
+                by_alias=True,
+                include=include,
+                exclude=to_exclude,
+                exclude_none=exclude_none,
+                exclude_unset=exclude_unset
+            )
+        if self.__encrypted_fields__:
+            # Also encrypts the plain str assigned to the fields, the walkers below only look for EncryptedStr values
+            public_key = config['encryption_config']['public_key']
+            for alias in self.__encrypted_fields__:
+                value = dump.get(alias)
+                if isinstance(value, str):
+                    dump[alias] = EncryptedStr.encrypt(value, public_key)
+        if self.__walk_encrypted__:
+            if self.__needs_object_id_walk__:
+                return self._encode_for_mongo(dump)
+            return self.encrypt_encrypted_fields(dump)
+        if self.__needs_object_id_walk__:
+            # The dump is not shared with the caller, it can be modified in place
+            dump = _walk(dump, self.cast_to_object_id, None)
         return dump
 
     async def before_create(self):
         """ Before create hook """
         pass
 
-    async def _create(self):
+    async def _create(self, bulk=False):
         await self.before_create()
         self.id = self.__id_factory__()
         await self.before_save()
-        await self.get_collection().insert_one(
-            self._get_dict_with_oid(creation=True)
-        )
+        document = self._get_dict_with_oid(creation=True)
+        if bulk:
+            await self.__bulk_writer__.write(InsertOne(document))
+        else:
+            await self.get_collection().insert_one(document)
+        self._mark_clean()
         await self.after_save()
         logger.debug(f"Created {self.__collection_name__} with id {self.id}")
         await self.after_create()
@@ -209,15 +669,18 @@ class MongoODMBase(MongODMBaseModel):
         projection: dict = None
     ):  # -> Self
         try:
-            item = await cls.get_collection().find_one(
-                cls._get_fetch_filter({"_id": item_id}),
-                projection=projection
-            )
+            if projection is None and isinstance(item_id, (str, ObjectId)):
+                # Concurrent lookups by id are grouped in a single query
+                item = await cls.__find_batcher__.get(item_id)
+            else:
+                item = await cls.get_collection().find_one(
+                    cls._get_fetch_filter({"_id": item_id}),
+                    projection=cls._default_projection(projection)
+                )
         except bson.errors.InvalidId:
             raise InvalidSelection
         if item:
-            item = cls.decrypt_encrypted_fields(item)
-            e = cls(**item)
+            e = cls._from_db(item)
             await e.after_find()
             return e
         raise NotFound
@@ -232,13 +695,12 @@ class MongoODMBase(MongODMBaseModel):
         try:
             item = await cls.get_collection().find_one(
                 cls._get_fetch_filter(fields),
-                projection=projection
+                projection=cls._default_projection(projection)
             )
         except bson.errors.InvalidId:
             raise InvalidSelection
         if item:
-            item = cls.decrypt_encrypted_fields(item)
-            e = cls(**item)
+            e = cls._from_db(item)
             await e.after_find()
             return e
         raise NotFound
@@ -253,13 +715,12 @@ class MongoODMBase(MongODMBaseModel):
         try:
             item = await cls.get_collection().find_one(
                 cls._get_fetch_filter(mongo_selector),
-                projection=projection
+                projection=cls._default_projection(projection)
             )
         except bson.errors.InvalidId:
             raise InvalidSelection
         if item:
-            item = cls.decrypt_encrypted_fields(item)
-            e = cls(**item)
+            e = cls._from_db(item)
             await e.after_find()
             return e
         raise NotFound
@@ -277,6 +738,20 @@ class MongoODMBase(MongODMBaseModel):
             cls._get_fetch_filter(mongo_selector)
         )
 
+    @classmethod
+    def _find_many(cls, page, per_page, selector, projection, sort, batch_size):
+        if sort is None:
+            sort = _DEFAULT_SORT
+        selector = cls.replace_str_with_object_id(selector)
+        cursor = cls.get_collection()\
+            .find(cls._get_fetch_filter(selector), projection=cls._default_projection(projection))\
+            .sort(sort)\
+            .skip((page - 1) * per_page)\
+            .limit(per_page)
+        if batch_size is not None:
+            cursor = cursor.batch_size(batch_size)
+        return cursor
+
     @classmethod
     async def get_all(
         cls,
@@ -285,21 +760,45 @@ class MongoODMBase(MongODMBaseModel):
         selector: dict = None,
         projection: dict = None,
         sort: dict = None,
+        batch_size: int = None,
         **kwargs,
     ) -> list:  # -> List[Self]
+        """
+        The documents are turned into instances as the cursor receives them, batch_size sets the number of documents
+        per round trip (defaults to the driver's behaviour).
+        """
         if selector is None:
             selector = kwargs
-        if sort is None:
-            sort = [("created_at", pymongo.DESCENDING)]
-        selector = cls.replace_str_with_object_id(selector)
-        items = await cls.get_collection()\
-            .find(cls._get_fetch_filter(selector), projection=projection)\
-            .sort(sort)\
-            .skip((page - 1) * per_page)\
-            .limit(per_page)\
-            .to_list(length=None)
+        cursor = cls._find_many(page, per_page, selector, projection, sort, batch_size)
+        instances = [cls._from_db(item) async for item in cursor]
+        if not cls.__after_find_is_noop__:
+            await asyncio.gather(*(instance.after_get_many_hook() for instance in instances))
+        return instances
 
-        return [await cls(**cls.decrypt_encrypted_fields(item)).after_get_many_hook() for item in items]
+    @classmethod
+    async def iter_all(
+        cls,
+        page: int = 1,
+        per_page: int = 20,
+        selector: dict = None,
+        projection: dict = None,
+        sort: dict = None,
+        batch_size: int = 100,
+        **kwargs,
+    ):  # -> AsyncIterator[Self]
+        """
+        Same as get_all, but yields the instances one by one while the cursor is consumed instead of loading the
+        whole page in memory. Use per_page=0 to iterate over every matching document.
+        """
+        if selector is None:
+            selector = kwargs
+        cursor = cls._find_many(page, per_page, selector, projection, sort, batch_size)
+        skip_hooks = cls.__after_find_is_noop__
+        async for item in cursor:
+            instance = cls._from_db(item)
+            if not skip_hooks:
+                await instance.after_get_many_hook()
+            yield instance
 
     async def before_save(self):
         """ Before save hook """
@@ -308,26 +807,67 @@ class MongoODMBase(MongODMBaseModel):
     async def before_update(self, payload):
         return payload
 
-    async def save(self, exclude_none=False, exclude_unset=False):  # -> Self
-        create = False
+    async def save(self, exclude_none=False, exclude_unset=False, bulk=False):  # -> Self
+        """
+        With bulk=True, the write is grouped with the other bulk writes of the model requested during the same event
+        loop iteration into a single bulk_write, and updated_at is not refreshed from the database.
+        """
         if self.id is None:
-            create = True
-            return await self._create()
+            # _create runs the whole creation hook sequence, including before_save
+            return await self._create(bulk=bulk)
         await self.before_save()
-        payload = self._get_dict_with_oid(exclude=True, exclude_none=exclude_none, exclude_unset=exclude_unset)
-        update_timestamp = datetime.now()
-        self.updated_at = payload['updated_at'] = update_timestamp
-        if not create:
-            payload = await self.before_update(payload)
-        await self.get_collection().update_one(
-            self.__class__._get_fetch_filter({"_id": self.__id_marshaller__(self.id)}),
-            {"$set": payload},
+        dirty_fields = self._dirty_fields
+        if dirty_fields is not None and not dirty_fields:
+            # Nothing was assigned since the instance was loaded or saved, before_update never ran
+            await self.after_save()
+            return self
+        payload = self._get_dict_with_oid(
+            exclude=True,
+            exclude_none=exclude_none,
+            exclude_unset=exclude_unset,
+            include=dirty_fields
         )
-        if not create:
-            await self.after_update()
+        payload = await self.before_update(payload)
+        update = {"$set": payload} if payload else {}
+        if 'updated_at' not in payload:
+            # Let the server stamp the update, unless a before_update hook already did it
+            update["$currentDate"] = {"updated_at": True}
+        selector = self.__class__._get_fetch_filter({"_id": self._get_marshalled_id()})
+        if bulk:
+            await self.__bulk_writer__.write(UpdateOne(selector, update))
+        else:
+            document = await self.get_collection().find_one_and_update(
+                selector,
+                update,
+                projection={"updated_at": True},
+                return_document=ReturnDocument.AFTER,
+            )
+            if document is not None:
+                self.updated_at = document.get("updated_at")
+        self._mark_clean()
+        await self.after_update()
         await self.after_save()
         return self
 
+    @classmethod
+    async def bulk_save(cls, items: list) -> list:  # -> List[Self]
+        """
+        Insert new instances with a single insert_many instead of one round trip per instance.
+        Ids are generated for the instances that don't have one. The hooks are not called.
+        """
+        if not items:
+            return items
+        for item in items:
+            if item.id is None:
+                item.id = item.__id_factory__()
+        await cls.get_collection().insert_many(
+            [item._get_dict_with_oid(creation=True) for item in items],
+            ordered=False
+        )
+        for item in items:
+            item._mark_clean()
+        return items
+
     async def after_update(self):
         """ After update hook """
         pass
@@ -340,33 +880,54 @@ class MongoODMBase(MongODMBaseModel):
         """ Before delete hook """
         pass
 
-    async def delete(self):
+    async def delete(self, bulk=False):
+        """ With bulk=True, the write is grouped like in save(bulk=True) """
         await self.before_delete()
         if config["soft_delete"]:
-            await self._soft_delete()
+            await self._soft_delete(bulk=bulk)
         else:
-            await self._hard_delete()
+            await self._hard_delete(bulk=bulk)
         await self.after_delete()
 
+    @classmethod
+    async def bulk_delete(cls, items: list):
+        """
+        Delete instances with a single query, following the soft delete configuration. The hooks are not called.
+        """
+        if not items:
+            return
+        selector = {"_id": {"$in": [item._get_marshalled_id() for item in items]}}
+        if config["soft_delete"]:
+            await cls.get_collection().update_many(
+                cls._get_fetch_filter(selector),
+                {"$currentDate": {"deleted_at": True}},
+            )
+        else:
+            await cls.get_collection().delete_many(selector)
+
     async def after_delete(self):
         """ After delete hook """
         pass
 
-    async def _soft_delete(self):
-        await self.get_collection().update_one(
-            self.__class__._get_fetch_filter({"_id": self.__id_marshaller__(self.id)}),
-            {"$set": {"deleted_at": datetime.now()}},
-        )
+    async def _soft_delete(self, bulk=False):
+        selector = self.__class__._get_fetch_filter({"_id": self._get_marshalled_id()})
+        update = {"$currentDate": {"deleted_at": True}}
+        if bulk:
+            await self.__bulk_writer__.write(UpdateOne(selector, update))
+        else:
+            await self.get_collection().update_one(selector, update)
         await self.after_soft_delete()
 
     async def after_soft_delete(self):
         """ After soft delete hook """
         pass
 
-    async def _hard_delete(self):
-        await self.get_collection().delete_one(
-            {"_id": self.__id_marshaller__(self.id)}
-        )
+    async def _hard_delete(self, bulk=False):
+        selector = {"_id": self._get_marshalled_id()}
+        if bulk:
+            await self.__bulk_writer__.write(DeleteOne(selector))
+        else:
+            await self.get_collection().delete_one(selector)
         await self.after_hard_delete()
 
     async def after_hard_delete(self):
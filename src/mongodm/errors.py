@@ -2,11 +2,12 @@ class MongODMException(Exception):
     message: str
 
     def __init__(self, message=None):
+        # A message passed when raising takes precedence over the default message of the class
         if message:
             self.message = message
 
     def __repr__(self):
-        self.__str__()
+        return self.__str__()
 
     def __str__(self):
         return self.message
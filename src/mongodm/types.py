@@ -1,14 +1,87 @@
+import functools
 import logging
-import traceback
+import os
+import re
 from typing import Annotated
 
 import pydantic
-from bson import ObjectId, errors
+from bson import ObjectId
 import rsa
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric.padding import MGF1, OAEP, PKCS1v15
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateNumbers, RSAPublicNumbers
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from pyasn1.error import PyAsn1Error
 
 from mongodm.errors import RSAError
 
 
+logger = logging.getLogger('mongodm')
+
+_NONCE_SIZE = 12
+# Padding of the wrapped session keys
+_PADDING = OAEP(mgf=MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None)
+# Padding the rsa package used for the values encrypted directly with RSA, only needed to read them
+_LEGACY_PADDING = PKCS1v15()
+
+OBJECT_ID_PATTERN = re.compile(r"[0-9a-fA-F]{24}")
+
+
+@functools.lru_cache(maxsize=4)
+def load_public_key(key):
+    """ Parse a PEM encoded RSA public key or convert a rsa.PublicKey, once, into an OpenSSL backed key """
+    try:
+        if not isinstance(key, rsa.PublicKey):
+            if isinstance(key, str):
+                key = key.encode('utf-8')
+            if b'BEGIN PUBLIC KEY' in key:
+                key = rsa.PublicKey.load_pkcs1_openssl_pem(key)
+            else:
+                key = rsa.PublicKey.load_pkcs1(key)
+        return RSAPublicNumbers(key.e, key.n).public_key()
+    except (AttributeError, TypeError, ValueError, PyAsn1Error):
+        logger.exception("Could not load the public key")
+        raise RSAError()
+
+
+@functools.lru_cache(maxsize=4)
+def load_private_key(key):
+    """ Parse a PEM encoded RSA private key or convert a rsa.PrivateKey, once, into an OpenSSL backed key """
+    try:
+        if not isinstance(key, rsa.PrivateKey):
+            if isinstance(key, str):
+                key = key.encode('utf-8')
+            key = rsa.PrivateKey.load_pkcs1(key)
+        return RSAPrivateNumbers(
+            p=key.p,
+            q=key.q,
+            d=key.d,
+            dmp1=key.exp1,
+            dmq1=key.exp2,
+            iqmp=key.coef,
+            public_numbers=RSAPublicNumbers(key.e, key.n)
+        ).private_key()
+    except (AttributeError, TypeError, ValueError, PyAsn1Error):
+        logger.exception("Could not load the private key")
+        raise RSAError()
+
+
+@functools.lru_cache(maxsize=4)
+def _get_session_cipher(public_key):
+    """
+    AES key generated once per process and public key. Its RSA encrypted form is stored in front of every value, so
+    a single RSA operation is needed per process instead of one per field.
+    """
+    key = AESGCM.generate_key(bit_length=256)
+    return load_public_key(public_key).encrypt(key, _PADDING), AESGCM(key)
+
+
+@functools.lru_cache(maxsize=64)
+def _get_stored_cipher(wrapped_key: bytes, private_key):
+    return AESGCM(load_private_key(private_key).decrypt(wrapped_key, _PADDING))
+
+
 class ObjectIdStr(str):
     @classmethod
     def __get_validators__(cls):
@@ -23,13 +96,14 @@ class ObjectIdStr(str):
 
     @classmethod
     def is_object_id(cls, v):
-        try:
-            v = ObjectId(v)
-        except errors.InvalidId:
-            return False
-        if not isinstance(v, ObjectId):
-            return False
-        return True
+        # Same rules as the ObjectId constructor, without raising and catching an exception for invalid values
+        if isinstance(v, ObjectId):
+            return True
+        if isinstance(v, str):
+            return len(v) == 24 and OBJECT_ID_PATTERN.fullmatch(v) is not None
+        if isinstance(v, bytes):
+            return len(v) == 12
+        return False
 
 
 class EncryptedStr(str):
@@ -46,16 +120,25 @@ class EncryptedStr(str):
 
     def encrypt(self, public_key):
         try:
-            return rsa.encrypt(self.encode('utf-8'), public_key)
-        except (AttributeError, rsa.pkcs1.CryptoError) as e:
-            logging.error(e)
-            logging.error(traceback.format_exc())
+            wrapped_key, cipher = _get_session_cipher(public_key)
+        except (AttributeError, ValueError):
+            # The traceback is only formatted if the record is actually emitted
+            logger.exception("Could not encrypt value")
             raise RSAError()
+        nonce = os.urandom(_NONCE_SIZE)
+        return wrapped_key + nonce + cipher.encrypt(nonce, self.encode('utf-8'), None)
 
 def decrypt(data: bytes, private_key):
     try:
-        return rsa.decrypt(data, private_key).decode('utf-8')
-    except (AttributeError, rsa.pkcs1.CryptoError) as e:
-        logging.error(e)
-        logging.error(traceback.format_exc())
+        rsa_key = load_private_key(private_key)
+        key_size = (rsa_key.key_size + 7) // 8
+        if len(data) == key_size:
+            # Values written before the session keys were introduced are directly RSA encrypted
+            return rsa_key.decrypt(data, _LEGACY_PADDING).decode('utf-8')
+        # OpenSSL keys are not hashable, the stored ciphers are cached by the configured key instead
+        cipher = _get_stored_cipher(data[:key_size], private_key)
+        nonce_end = key_size + _NONCE_SIZE
+        return cipher.decrypt(data[key_size:nonce_end], data[nonce_end:], None).decode('utf-8')
+    except (AttributeError, ValueError, InvalidTag):
+        logger.exception("Could not decrypt value")
         raise RSAError()